@@ -0,0 +1,116 @@
+"""Measures the peak memory of loading a compiled graph and searching it, on a large synthetic ski area.
+
+The ski area is built by repeating an Overpass file with shifted node ids and coordinates.
+The peak of the Python allocations traced by tracemalloc, not the RSS of the process, is measured from
+before the artifact is opened until the search has finished. It is divided by the edges of the compacted
+graph that is loaded, and the lean mode is checked against the budget documented in the README.
+
+Usage:
+    python benchmarks/memory_benchmark.py [copies] [overpass_json]
+"""
+import copy
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from route_creation.compiled_graph import compile_resort, save_compiled_graph, load_compiled_graph
+from route_creation.dijkstra import dijkstra, bounded_dijkstra
+
+DEFAULT_DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'geoJsonData', 'isabergData.json')
+
+# Peak traced bytes per edge of the loaded compacted graph allowed for loading a lean graph and searching it
+LEAN_BYTES_PER_EDGE = 176
+
+
+def repeat_ski_area(overpass_data: dict, copies: int) -> dict:
+    """Creates a larger ski area by repeating the elements with shifted node ids and coordinates.
+
+    Consecutive copies are joined by a piste in both directions, so the area is a single connected component.
+
+    Args:
+        overpass_data (dict): The Overpass data to repeat
+        copies (int): The number of copies
+
+    Returns:
+        dict: The repeated Overpass data
+    """
+    elements = []
+    first = overpass_data['elements'][0]
+    for i in range(copies):
+        for element in overpass_data['elements']:
+            element = copy.deepcopy(element)
+            element['nodes'] = [node_id + i * 10**11 for node_id in element['nodes']]
+            for geometry in element['geometry']:
+                geometry['lat'] += i * 0.05
+            elements.append(element)
+        if i > 0:
+            nodes = [first['nodes'][0] + (i - 1) * 10**11, first['nodes'][0] + i * 10**11]
+            geometry = [{'lat': first['geometry'][0]['lat'] + copy_index * 0.05, 'lon': first['geometry'][0]['lon']}
+                        for copy_index in (i - 1, i)]
+            for direction in (1, -1):
+                elements.append({'type': 'way', 'id': -2 * i - (direction == -1), 'nodes': nodes[::direction],
+                                 'geometry': geometry[::direction], 'tags': {'piste:type': 'downhill'}})
+    return {'elements': elements}
+
+
+def measure_peak(directory: str, lean: bool, start: int, end: int):
+    """Loads the best route graph of the ski area and searches it, tracing the peak memory.
+
+    Args:
+        directory (str): The directory containing the compiled artifacts
+        lean (bool): Whether to load the graph as an ArrayGraph
+        start (int): The id of the start node
+        end (int): The id of the end node
+
+    Returns:
+        tuple: The bytes still allocated by the graph, and the peak bytes of loading and searching
+    """
+    tracemalloc.start()
+    graph, _ = load_compiled_graph(directory, 'area', True, lean)
+    graph_bytes = tracemalloc.get_traced_memory()[0]
+    dijkstra(graph, start, end)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return graph_bytes, peak
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    data_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_DATA
+    with open(data_path, 'r') as file:
+        overpass_data = repeat_ski_area(json.load(file), copies)
+
+    with tempfile.TemporaryDirectory() as directory:
+        compiled = compile_resort(overpass_data)
+        save_compiled_graph(directory, 'area', compiled)
+        graph, packed_edges = compiled['graphs']['best']
+        # Budgets are per edge of the loaded compacted graph, the contracted nodes are reported separately
+        nodes = compiled['stats']['nodes']
+        edges = sum(len(neighbors) for neighbors in graph.values())
+        packed_nodes = sum(len(interior) for interior in packed_edges.values())
+        del overpass_data, compiled, packed_edges
+
+        # Search towards the farthest node reachable from the start, so the whole component is explored
+        start = next(iter(graph))
+        node_weights = bounded_dijkstra(graph, start, float('infinity'))
+        end = max(node_weights, key=node_weights.get)
+        compacted_nodes = len(graph)
+        del graph
+
+        dict_bytes, dict_peak = measure_peak(directory, False, start, end)
+        lean_bytes, lean_peak = measure_peak(directory, True, start, end)
+
+    print(f"{nodes} nodes ({compacted_nodes} compacted), {edges} compacted edges packing {packed_nodes} nodes, "
+          f"search reaches {len(node_weights)} nodes")
+    print(f"dict graph:  {dict_bytes / edges:.0f} bytes/edge loaded, load and search peak {dict_peak / edges:.0f} bytes/edge")
+    print(f"array graph: {lean_bytes / edges:.0f} bytes/edge loaded, load and search peak {lean_peak / edges:.0f} bytes/edge")
+    print(f"lean peak budget {LEAN_BYTES_PER_EDGE} traced bytes/edge")
+    return 0 if lean_peak <= LEAN_BYTES_PER_EDGE * edges else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Compares the priority queue implementations used by the Dijkstra search.
+
+Usage:
+    python benchmarks/queue_benchmark.py [overpass_json]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from route_creation.dijkstra import search
+from route_creation.graph import create_graph
+from route_creation.priority_queue import QUEUE_TYPES
+
+DEFAULT_DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'geoJsonData', 'isabergData.json')
+
+
+def run_benchmark(graph: dict, queue_type: str, pairs: list) -> dict:
+    """Runs a search for every start/end pair and sums the queue counters.
+
+    Args:
+        graph (dict): The graph to search
+        queue_type (str): The priority queue implementation
+        pairs (list): A list of (start, end) node id tuples
+
+    Returns:
+        dict: The elapsed time in seconds and the summed queue counters
+    """
+    totals = {'pushes': 0, 'pops': 0, 'stale_pops': 0, 'decrease_keys': 0}
+    started = time.perf_counter()
+    for start, end in pairs:
+        stats = search(graph, start, end, queue_type).priority_queue.stats.as_dict()
+        for key, value in stats.items():
+            totals[key] += value
+    totals['seconds'] = time.perf_counter() - started
+    return totals
+
+
+def main():
+    data_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DATA
+    with open(data_path, 'r') as file:
+        overpass_data = json.load(file)
+
+    for isBestRoute in [False, True]:
+        graph = create_graph(overpass_data, isBestRoute)
+        nodes = list(graph)
+        pairs = [(start, end) for start in nodes[::40] for end in nodes[::40]]
+        print(f"isBestRoute={isBestRoute}: {len(nodes)} nodes, {len(pairs)} searches")
+        for queue_type in QUEUE_TYPES:
+            result = run_benchmark(graph, queue_type, pairs)
+            print(f"  {queue_type:<7} {result['seconds']:.3f}s pushes={result['pushes']} pops={result['pops']} "
+                  f"stale_pops={result['stale_pops']} decrease_keys={result['decrease_keys']}")
+
+
+if __name__ == '__main__':
+    main()
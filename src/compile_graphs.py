@@ -0,0 +1,76 @@
+"""Precompiles and validates the route graphs of every resort in a directory of Overpass JSON files.
+
+Usage:
+    python src/compile_graphs.py <overpass_dir> [--output compiled_graphs] [--jobs N]
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from route_creation.compiled_graph import compile_resort, save_compiled_graph
+
+
+def compile_file(json_path: str, output_dir: str) -> dict:
+    """Compiles the graphs of a single resort and writes the artifact.
+
+    Args:
+        json_path (str): The path of the Overpass JSON file of the resort
+        output_dir (str): The directory to write the artifact to
+
+    Returns:
+        dict: The resort name, build time and graph statistics, or the error if the build failed
+    """
+    resort = os.path.splitext(os.path.basename(json_path))[0]
+    try:
+        with open(json_path, 'r') as file:
+            filtered_data = json.load(file)
+        compiled = compile_resort(filtered_data)
+        save_compiled_graph(output_dir, resort, compiled)
+    except Exception as error:
+        # One malformed resort must not abort the whole batch
+        return {'resort': resort, 'error': f"{type(error).__name__}: {error}"}
+    return {'resort': resort, 'build_time': compiled['build_time'], **compiled['stats']}
+
+
+def format_report(result: dict) -> str:
+    """Formats the result of a resort build as a single report line.
+
+    Args:
+        result (dict): The result returned by compile_file
+
+    Returns:
+        str: The report line
+    """
+    if 'error' in result:
+        return f"{result['resort']}: FAILED {result['error']}"
+    unreachable = result['unreachable_lift_heads']
+    return (f"{result['resort']}: {result['build_time']:.2f}s, {result['nodes']} nodes ({result['compacted_nodes']} compacted), "
+            f"{result['edges']} edges, "
+            f"{result['stranded']} stranded, {len(unreachable)} unreachable lift heads"
+            + (f" {unreachable}" if unreachable else ""))
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompile the route graphs of a directory of Overpass JSON files.")
+    parser.add_argument('input_dir', help="Directory containing one Overpass JSON file per resort")
+    parser.add_argument('--output', default='compiled_graphs', help="Directory to write the compiled graphs to")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="Number of resorts to build in parallel")
+    args = parser.parse_args(argv)
+
+    json_paths = sorted(
+        os.path.join(args.input_dir, name) for name in os.listdir(args.input_dir) if name.endswith('.json'))
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        for result in executor.map(compile_file, json_paths, [args.output] * len(json_paths)):
+            print(format_report(result))
+            failures += 'error' in result
+
+    print(f"Compiled {len(json_paths) - failures} of {len(json_paths)} resorts to {args.output}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,68 @@
+import os
 from flask import Flask, request
-from route_creation.route_creator import generate_rated_route
+from route_creation.route_creator import generate_rated_route, generate_timed_route, generate_reachability
+from route_creation.compiled_graph import get_compiled_graph
+from route_creation.time_dependent import LiftSchedule
+from route_creation.priority_queue import QUEUE_TYPES
 
 app = Flask(__name__)
 
+# Lift schedules per resort, updated in place by /lift-wait-times
+lift_schedules = {}
+
+# Directory with the artifacts written by compile_graphs.py
+COMPILED_GRAPHS_DIR = os.environ.get('COMPILED_GRAPHS_DIR', 'compiled_graphs')
+# Load compiled graphs into flat arrays, for very large ski areas
+LEAN_GRAPHS = os.environ.get('LEAN_GRAPHS', '') == '1'
+
+def invalid_queue_type(request_data: dict):
+    """Returns a 400 response if the request asks for an unknown priority queue, otherwise None."""
+    queue_type = request_data.get('queueType', 'binary')
+    if queue_type not in QUEUE_TYPES:
+        return {'error': f"Unknown queueType '{queue_type}', expected one of {sorted(QUEUE_TYPES)}"}, 400
+    return None
+
+def compiled_graph(request_data: dict, isBestRoute: bool):
+    """Returns the compiled graph and packed edges of the requested resort, or None, None if there are none."""
+    if 'resort' not in request_data:
+        return None, None
+    return get_compiled_graph(COMPILED_GRAPHS_DIR, request_data['resort'], isBestRoute, LEAN_GRAPHS) or (None, None)
+
 @app.route('/generate-route', methods=['POST'])
 def generate_route():
     request_data = request.get_json().get('data', "No data found")
-    return generate_rated_route(request_data['start'], request_data['end'], request_data['isBestRoute'], request_data['geoJson'])
+    error = invalid_queue_type(request_data)
+    if error:
+        return error
+    graph, packed_edges = compiled_graph(request_data, request_data['isBestRoute'])
+    return generate_rated_route(request_data['start'], request_data['end'], request_data['isBestRoute'], request_data['geoJson'], request_data.get('queueType', 'binary'), graph, packed_edges)
+
+@app.route('/generate-timed-route', methods=['POST'])
+def generate_timed():
+    request_data = request.get_json().get('data', "No data found")
+    # Schedules sent with the request only apply to it, the shared ones change through /lift-wait-times
+    request_schedules = dict(lift_schedules.get(request_data.get('resort'), {}))
+    for way_id, schedule in request_data.get('liftSchedules', {}).items():
+        request_schedules[int(way_id)] = LiftSchedule.from_dict(schedule, request_schedules.get(int(way_id)))
+    graph, packed_edges = compiled_graph(request_data, False)
+    return generate_timed_route(request_data['start'], request_data['end'], request_data['departureTime'], request_data['geoJson'], request_schedules, graph, packed_edges)
+
+@app.route('/lift-wait-times', methods=['POST'])
+def update_lift_wait_times():
+    request_data = request.get_json().get('data', "No data found")
+    resort_schedules = lift_schedules.setdefault(request_data['resort'], {})
+    for way_id, wait in request_data['waits'].items():
+        resort_schedules.setdefault(int(way_id), LiftSchedule()).set_wait_time(wait, request_data.get('fromTime'))
+    return {'updated': len(request_data['waits'])}
+
+@app.route('/reachability', methods=['POST'])
+def reachability():
+    request_data = request.get_json().get('data', "No data found")
+    error = invalid_queue_type(request_data)
+    if error:
+        return error
+    graph, packed_edges = compiled_graph(request_data, request_data['isBestRoute'])
+    return generate_reachability(request_data['start'], request_data['maxWeight'], request_data['isBestRoute'], request_data['geoJson'], request_data.get('queueType', 'binary'), graph, packed_edges)
 
 if __name__ == '__main__':
     app.run(port=3500, host='0.0.0.0', debug=True)
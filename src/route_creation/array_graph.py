@@ -0,0 +1,117 @@
+from array import array
+from bisect import bisect_left
+
+
+class ArrayGraph:
+    """A read-only graph stored in flat arrays instead of a dict of tuple lists.
+
+    The node ids are kept sorted, and the neighbors of the node at index i are stored
+    in targets[offsets[i]:offsets[i + 1]] as indices into node_ids, with their weights
+    at the same positions in weights. It supports the dict operations used by the
+    search, so it can be passed to dijkstra in place of a graph dict.
+
+    args:
+        node_ids (array): The sorted node ids
+        offsets (array): The start of the neighbors of every node, followed by the total edge count
+        targets (array): The index of the neighbor node of every edge
+        weights (array): The weight of every edge
+    """
+    __slots__ = ('node_ids', 'offsets', 'targets', 'weights')
+
+    def __init__(self, node_ids: array, offsets: array, targets: array, weights: array):
+        self.node_ids = node_ids
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_items(cls, items):
+        """Creates an array graph from (node_id, neighbors) pairs.
+
+        Args:
+            items (iterable): Pairs of a node id and its list of (neighbor, weight) edges
+
+        Returns:
+            ArrayGraph: The array backed graph
+        """
+        neighbors_by_node = dict(items)
+        # Neighbors without edges of their own still need an index
+        node_id_set = set(neighbors_by_node)
+        node_id_set.update(neighbor for neighbors in neighbors_by_node.values() for neighbor, _ in neighbors)
+        node_ids = array('q', sorted(node_id_set))
+        return cls.from_sorted_items(node_ids, ((node_id, neighbors_by_node.get(node_id, [])) for node_id in node_ids))
+
+    @classmethod
+    def from_sorted_items(cls, node_ids: array, items):
+        """Creates an array graph from (node_id, neighbors) pairs in the order of node_ids.
+
+        Only one pair is held at a time, so items can be read lazily, e.g. from a compiled artifact.
+
+        Args:
+            node_ids (array): Every node id of the graph, sorted
+            items (iterable): A pair of a node id and its list of (neighbor, weight) edges for every node in node_ids
+
+        Returns:
+            ArrayGraph: The array backed graph
+        """
+        offsets = array('l', [0])
+        targets = array('l')
+        weights = array('d')
+        for _, neighbors in items:
+            for neighbor, weight in neighbors:
+                targets.append(bisect_left(node_ids, neighbor))
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(node_ids, offsets, targets, weights)
+
+    @classmethod
+    def from_graph(cls, graph: dict):
+        """Creates an array graph from a graph dict.
+
+        Args:
+            graph (dict): The graph representing the connections between nodes
+
+        Returns:
+            ArrayGraph: The array backed graph
+        """
+        return cls.from_items(graph.items())
+
+    def index_of(self, node_id: int) -> int:
+        """Finds the position of a node in node_ids.
+
+        Args:
+            node_id (int): The id of the node
+
+        Returns:
+            int: The index of the node
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        index = bisect_left(self.node_ids, node_id)
+        if index == len(self.node_ids) or self.node_ids[index] != node_id:
+            raise KeyError(node_id)
+        return index
+
+    def __getitem__(self, node_id: int) -> list:
+        index = self.index_of(node_id)
+        return [(self.node_ids[self.targets[edge]], self.weights[edge])
+                for edge in range(self.offsets[index], self.offsets[index + 1])]
+
+    def __contains__(self, node_id: int) -> bool:
+        index = bisect_left(self.node_ids, node_id)
+        return index < len(self.node_ids) and self.node_ids[index] == node_id
+
+    def __iter__(self):
+        return iter(self.node_ids)
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def items(self):
+        for node_id in self.node_ids:
+            yield node_id, self[node_id]
+
+    def values(self):
+        for _, neighbors in self.items():
+            yield neighbors
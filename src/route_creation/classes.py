@@ -1,12 +1,22 @@
+from .priority_queue import create_priority_queue
+
 class DijkstraData:
 	"""
  		A class to store the data structures used in Dijkstra's algorithm.
+
+	Only the nodes reached by the search are stored, so nodes missing from
+	weights have an infinite weight and no previous node.
+
+	args:
+		start_node (int): The ID of the start node
+		queue_type (str): The priority queue implementation, one of 'binary', 'dary' or 'radix'
+		start_weight (float): The weight of the start node, e.g. the departure time of a time-dependent search
 	"""
-	def __init__(self, start_node: float, graph: dict):
-		self.weights = {node: float('infinity') for node in graph}
-		self.weights[start_node] = 0
-		self.previous_nodes = {node: None for node in graph}
-		self.priority_queue = [(0, start_node)]
+	def __init__(self, start_node: float, queue_type: str = 'binary', start_weight: float = 0):
+		self.weights = {start_node: start_weight}
+		self.previous_nodes = {start_node: None}
+		self.priority_queue = create_priority_queue(queue_type)
+		self.priority_queue.push(start_node, start_weight)
   
 class Node:
 	"""A class to represent a node in the graph. 
@@ -0,0 +1,226 @@
+import json
+import os
+import time
+from array import array
+
+from .array_graph import ArrayGraph
+from .graph_compaction import PackedEdges, compact_graph
+from .graph import create_graph, find_connections_for_stranded_nodes, find_lift_first_nodes, check_lift_first_nodes_connections
+from .time_dependent import find_lift_boardings
+
+COMPILED_GRAPH_SUFFIX = '.graph.jsonl'
+
+# Loaded graphs keyed by (directory, resort, isBestRoute, lean), with the artifact mtime they were loaded from
+compiled_graph_cache = {}
+
+def build_route_graph(filtered_data: dict, isBestRoute: bool = False) -> dict:
+    """Builds the graph exactly as it is built when a route is generated.
+
+    Args:
+        filtered_data (dict): The filtered geojson data
+        isBestRoute (bool): Whether to use the best route (rating-based) or shortest distance
+
+    Returns:
+        dict: A graph representing the connections between nodes
+    """
+    graph = create_graph(filtered_data, isBestRoute)
+    return find_connections_for_stranded_nodes(graph, filtered_data, isBestRoute)
+
+def graph_statistics(graph: dict, filtered_data: dict) -> dict:
+    """Counts the nodes and edges of a graph and finds the nodes a route cannot pass through.
+
+    Args:
+        graph (dict): The graph representing the connections between nodes
+        filtered_data (dict): The filtered geojson data the graph was built from
+
+    Returns:
+        dict: The node, edge and stranded node counts, and the ids of the lift heads that cannot be reached
+    """
+    lift_connections = check_lift_first_nodes_connections(graph, find_lift_first_nodes(filtered_data))
+    return {
+        'nodes': len(graph),
+        'edges': sum(len(neighbors) for neighbors in graph.values()),
+        'stranded': sum(1 for neighbors in graph.values() if not neighbors),
+        'unreachable_lift_heads': [node_id for node_id, connections in lift_connections.items() if not connections],
+    }
+
+def compile_resort(filtered_data: dict) -> dict:
+    """Builds and compacts the shortest and best route graphs for a resort.
+
+    The nodes of the first edge of every lift are kept, so lift queues can be applied to the compacted graphs.
+
+    Args:
+        filtered_data (dict): The filtered geojson data of the resort
+
+    Returns:
+        dict: The compiled resort, containing both (graph, packed edges) pairs, their statistics and the build time in seconds
+    """
+    started = time.perf_counter()
+    keep_nodes = set()
+    for lift_head, boardings in find_lift_boardings(filtered_data).items():
+        keep_nodes.add(lift_head)
+        keep_nodes.update(boardings)
+    shortest_graph = build_route_graph(filtered_data, False)
+    best_graph = build_route_graph(filtered_data, True)
+    compacted_shortest = compact_graph(shortest_graph, keep_nodes)
+    compacted_best = compact_graph(best_graph, keep_nodes)
+    build_time = time.perf_counter() - started
+
+    stats = graph_statistics(shortest_graph, filtered_data)
+    stats['compacted_nodes'] = len(compacted_shortest[0])
+    return {
+        'graphs': {
+            'shortest': compacted_shortest,
+            'best': compacted_best,
+        },
+        'stats': stats,
+        'build_time': build_time,
+    }
+
+def serialize_graph(graph: dict, packed_edges: dict = None):
+    """Converts a graph to JSON lines sorted by node id, one line per node.
+
+    A line is [node_id, [[neighbor, weight], ...]], followed by [[neighbor, [[node_id, weight], ...]], ...]
+    when edges of the node are packed. Nodes that are only reached as a neighbor get a line without edges,
+    so every node has a line.
+
+    Args:
+        graph (dict): The graph representing the connections between nodes
+        packed_edges (dict): The mapping from edges to their contracted nodes
+
+    Returns:
+        generator: The lines of the artifact
+    """
+    packed_by_node = {}
+    for (node_a, node_b), interior in (packed_edges or {}).items():
+        packed_by_node.setdefault(node_a, []).append([node_b, [list(entry) for entry in interior]])
+
+    node_ids = set(graph)
+    node_ids.update(neighbor for neighbors in graph.values() for neighbor, _ in neighbors)
+    for node_id in sorted(node_ids):
+        line = [node_id, [list(edge) for edge in graph.get(node_id, [])]]
+        if node_id in packed_by_node:
+            line.append(packed_by_node[node_id])
+        yield json.dumps(line) + '\n'
+
+def read_graph_lines(lines, packed_edges: dict):
+    """Parses lines created by serialize_graph, collecting the packed edges on the way.
+
+    Args:
+        lines (iterable): The lines of the artifact
+        packed_edges (dict): The mapping to add the packed edges to
+
+    Returns:
+        generator: The (node_id, [(neighbor, weight), ...]) pair of every line
+    """
+    for line in lines:
+        entry = json.loads(line)
+        node_id = entry[0]
+        for node_b, interior in entry[2] if len(entry) > 2 else []:
+            packed_edges[(node_id, node_b)] = [tuple(pair) for pair in interior]
+        yield node_id, [tuple(edge) for edge in entry[1]]
+
+def deserialize_graph(lines):
+    """Converts lines created by serialize_graph back to a graph.
+
+    Args:
+        lines (iterable): The lines of the artifact
+
+    Returns:
+        dict, PackedEdges: The graph representing the connections between nodes, and its indexed packed edges
+    """
+    packed_edges = PackedEdges()
+    graph = dict(read_graph_lines(lines, packed_edges))
+    return graph, packed_edges.index_nodes()
+
+def compiled_graph_path(directory: str, resort: str, isBestRoute: bool = False) -> str:
+    """Returns the path of a compiled graph of a resort.
+
+    Args:
+        directory (str): The directory containing the compiled artifacts
+        resort (str): The name of the resort
+        isBestRoute (bool): Whether to return the path of the best route (rating-based) or shortest distance graph
+
+    Returns:
+        str: The path of the artifact
+    """
+    graph_type = 'best' if isBestRoute else 'shortest'
+    return os.path.join(directory, f"{os.path.basename(resort)}.{graph_type}{COMPILED_GRAPH_SUFFIX}")
+
+def save_compiled_graph(directory: str, resort: str, compiled: dict):
+    """Writes the graphs of a compiled resort to the given directory, one artifact per graph type.
+
+    Both artifacts are written to temporary files next to them first and then renamed into place,
+    so a running server never loads a partially written graph.
+
+    Args:
+        directory (str): The directory to write the artifacts to
+        resort (str): The name of the resort
+        compiled (dict): The result of compile_resort
+    """
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    try:
+        for isBestRoute in [False, True]:
+            graph, packed_edges = compiled['graphs']['best' if isBestRoute else 'shortest']
+            path = compiled_graph_path(directory, resort, isBestRoute)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            written.append((temp_path, path))
+            with open(temp_path, 'w') as file:
+                file.writelines(serialize_graph(graph, packed_edges))
+        for temp_path, path in written:
+            os.replace(temp_path, path)
+    finally:
+        for temp_path, _ in written:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+def load_compiled_graph(directory: str, resort: str, isBestRoute: bool = False, lean: bool = False):
+    """Loads a graph of a resort from its compiled artifact, reading it line by line.
+
+    Args:
+        directory (str): The directory containing the compiled artifacts
+        resort (str): The name of the resort
+        isBestRoute (bool): Whether to load the best route (rating-based) or shortest distance graph
+        lean (bool): Whether to load the graph into an array backed ArrayGraph instead of a dict
+
+    Returns:
+        tuple: The graph (a dict or ArrayGraph) and its indexed packed edges, or None if the resort has not been compiled
+    """
+    path = compiled_graph_path(directory, resort, isBestRoute)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as file:
+        if not lean:
+            return deserialize_graph(file)
+        # The lines are sorted by node id, so the ids are read first and the edges are indexed on a second pass
+        node_ids = array('q', (int(line[1:line.index(',')]) for line in file))
+        file.seek(0)
+        packed_edges = PackedEdges()
+        graph = ArrayGraph.from_sorted_items(node_ids, read_graph_lines(file, packed_edges))
+        return graph, packed_edges.index_nodes()
+
+def get_compiled_graph(directory: str, resort: str, isBestRoute: bool = False, lean: bool = False):
+    """Returns the graph of a resort from the cache, loading it again only if the artifact has changed.
+
+    Args:
+        directory (str): The directory containing the compiled artifacts
+        resort (str): The name of the resort
+        isBestRoute (bool): Whether to load the best route (rating-based) or shortest distance graph
+        lean (bool): Whether to load the graph into an array backed ArrayGraph instead of a dict
+
+    Returns:
+        tuple: The graph (a dict or ArrayGraph) and its packed edges, or None if the resort has not been compiled
+    """
+    key = (directory, resort, isBestRoute, lean)
+    try:
+        mtime = os.stat(compiled_graph_path(directory, resort, isBestRoute)).st_mtime_ns
+    except OSError:
+        compiled_graph_cache.pop(key, None)
+        return None
+
+    cached = compiled_graph_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, load_compiled_graph(directory, resort, isBestRoute, lean))
+        compiled_graph_cache[key] = cached
+    return cached[1]
@@ -1,7 +1,6 @@
-import heapq
 from .classes import DijkstraData
 
-def dijkstra(graph: dict, start: int, end: int):
+def dijkstra(graph: dict, start: int, end: int, queue_type: str = 'binary'):
     """
     Find the most optimal path between two nodes in a graph using Dijkstra's algorithm based on some weight.
 
@@ -9,15 +8,31 @@ def dijkstra(graph: dict, start: int, end: int):
         graph (dict): The graph to search for the path
         start (int): The id of the start node
         end (int): The id of the end node
+        queue_type (str): The priority queue implementation, one of 'binary', 'dary' or 'radix'
 
     Returns:
         dict, float: A list of node ids representing the path, and the weight of the path
     """
-    dijkstra_data = DijkstraData(start, graph)
+    dijkstra_data = search(graph, start, end, queue_type)
+    return reconstruct_path(dijkstra_data, end), dijkstra_data.weights.get(end, float('infinity'))
+
+def search(graph: dict, start: int, end: int, queue_type: str = 'binary') -> DijkstraData:
+    """Runs Dijkstra's algorithm from the start node until the end node is settled.
+
+    Args:
+        graph (dict): The graph to search for the path
+        start (int): The id of the start node
+        end (int): The id of the end node
+        queue_type (str): The priority queue implementation, one of 'binary', 'dary' or 'radix'
+
+    Returns:
+        DijkstraData: The search state, including the priority queue counters in priority_queue.stats
+    """
+    dijkstra_data = DijkstraData(start, queue_type)
 
     while dijkstra_data.priority_queue:
-        # Get the node with the lowest weight
-        current_weight, current_node = heapq.heappop(dijkstra_data.priority_queue)
+        # Get the node with the lowest weight, stale entries are skipped by the queue
+        current_weight, current_node = dijkstra_data.priority_queue.pop()
         
         # If we've reached the end node, we can stop
         if current_node == end:
@@ -25,17 +40,48 @@ def dijkstra(graph: dict, start: int, end: int):
         
         explore_neighbors(graph, current_node, current_weight, dijkstra_data)
 
-    # Reconstruct the path
+    return dijkstra_data
+
+def bounded_dijkstra(graph: dict, start: int, max_weight: float, queue_type: str = 'binary') -> dict:
+    """Finds the weight of every node that can be reached from the start node within a maximum weight.
+
+    Args:
+        graph (dict): The graph to search
+        start (int): The id of the start node
+        max_weight (float): The cost cutoff, in km or rating weight depending on the graph
+        queue_type (str): The priority queue implementation, one of 'binary', 'dary' or 'radix'
+
+    Returns:
+        dict: A mapping from the ids of the reachable nodes to their weight
+    """
+    dijkstra_data = DijkstraData(start, queue_type)
+
+    while dijkstra_data.priority_queue:
+        current_weight, current_node = dijkstra_data.priority_queue.pop()
+        explore_neighbors(graph, current_node, current_weight, dijkstra_data, max_weight)
+
+    return dijkstra_data.weights
+
+def reconstruct_path(dijkstra_data: DijkstraData, end: int) -> list:
+    """Follows the previous nodes back from the end node to build the path.
+
+    Args:
+        dijkstra_data (DijkstraData): The data structures of a finished search
+        end (int): The id of the end node
+
+    Returns:
+        list: A list of node ids from the start node to the end node
+    """
     path = []
     current = end
     while current is not None:
         path.append(current)
-        current = dijkstra_data.previous_nodes[current]
+        current = dijkstra_data.previous_nodes.get(current)
     path.reverse()
  
-    return path, dijkstra_data.weights[end]
+    return path
 
-def explore_neighbors(graph: dict, current_node: int, current_weight: float, dijkstra_data: DijkstraData):
+def explore_neighbors(graph: dict, current_node: int, current_weight: float, dijkstra_data: DijkstraData, max_weight: float = float('infinity')):
     """Searches for the best path to the neighbors of the current node.
 
     Args:
@@ -43,12 +89,13 @@ def explore_neighbors(graph: dict, current_node: int, current_weight: float, dij
         current_node (int): The id of the current node
         current_weight (float): The weight of the current node
         dijkstra_data (DijkstraData): The data structures used in Dijkstra's algorithm. Contains the weights, previous nodes, and priority queue
+        max_weight (float): The cost cutoff, neighbors beyond it are never queued
     """
     for neighbor, weight in graph[current_node]:
         new_weight = current_weight + weight
         
-        # If the distance to the neighbor is shorter by taking this path
-        if new_weight < dijkstra_data.weights[neighbor]:
+        # If the distance to the neighbor is shorter by taking this path, and within the cutoff
+        if new_weight <= max_weight and new_weight < dijkstra_data.weights.get(neighbor, float('infinity')):
             dijkstra_data.weights[neighbor] = new_weight
             dijkstra_data.previous_nodes[neighbor] = current_node
-            heapq.heappush(dijkstra_data.priority_queue, (new_weight, neighbor))
+            dijkstra_data.priority_queue.push(neighbor, new_weight)
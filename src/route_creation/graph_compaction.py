@@ -0,0 +1,259 @@
+from collections import ChainMap
+
+
+class SplitGraph:
+    """A view of a compacted graph with extra edges to and from nodes inside contracted chains.
+
+    args:
+        graph (dict): The compacted graph
+        extra_edges (dict): A mapping from node ids to extra (neighbor, weight) edges
+    """
+    __slots__ = ('graph', 'extra_edges')
+
+    def __init__(self, graph: dict, extra_edges: dict):
+        self.graph = graph
+        self.extra_edges = extra_edges
+
+    def __getitem__(self, node_id: int) -> list:
+        neighbors = self.graph[node_id] if node_id in self.graph else []
+        extra = self.extra_edges.get(node_id)
+        return neighbors + extra if extra else neighbors
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self.graph or node_id in self.extra_edges
+
+
+class PackedEdges(dict):
+    """A mapping from (node_a, node_b) edges of a compacted graph to their contracted (node_id, weight from node_a) pairs.
+
+    args:
+        node_index (dict): A mapping from every contracted node to the edge packing it, built by index_nodes
+    """
+    __slots__ = ('node_index',)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.node_index = {}
+
+    def index_nodes(self):
+        """Indexes the contracted nodes, once all chains have been added.
+
+        Returns:
+            PackedEdges: The packed edges themselves
+        """
+        # The values are the keys of the packed edges themselves, so the index adds no tuple per node
+        self.node_index = {node_id: edge for edge, interior in self.items() for node_id, _ in interior}
+        return self
+
+
+def compact_graph(graph: dict, keep_nodes: set = None):
+    """Contracts chains of nodes with a single incoming and a single outgoing neighbor into single edges.
+
+    Args:
+        graph (dict): The graph representing the connections between nodes
+        keep_nodes (set): Node ids that must stay in the compacted graph, e.g. the lift boarding nodes
+
+    Returns:
+        dict, PackedEdges: The compacted graph, and a mapping from (node_a, node_b) edges to the contracted
+        (node_id, weight from node_a) pairs between them
+    """
+    keep_nodes = keep_nodes or set()
+    chain_nodes = find_chain_nodes(graph, keep_nodes)
+
+    compacted = {}
+    packed_edges = PackedEdges()
+    for node_id, neighbors in graph.items():
+        if node_id in chain_nodes:
+            continue
+        compacted.setdefault(node_id, [])
+        edges_by_end = {}
+        for neighbor, weight in neighbors:
+            end, total_weight, interior = follow_chain(graph, chain_nodes, neighbor, weight)
+            edges_by_end.setdefault(end, []).append((total_weight, interior))
+        for end, edges in edges_by_end.items():
+            add_packed_edges(compacted, packed_edges, node_id, end, sorted(edges, key=lambda edge: edge[0]))
+
+    return compacted, packed_edges.index_nodes()
+
+def find_chain_nodes(graph: dict, keep_nodes: set) -> set:
+    """Find the nodes that only pass a route on, having exactly one incoming and one outgoing neighbor.
+
+    Args:
+        graph (dict): The graph representing the connections between nodes
+        keep_nodes (set): Node ids that must not be contracted
+
+    Returns:
+        set: The ids of the contractible nodes
+    """
+    incoming = {}
+    for node_id, neighbors in graph.items():
+        for neighbor, _ in neighbors:
+            incoming.setdefault(neighbor, set()).add(node_id)
+
+    chain_nodes = set()
+    for node_id, neighbors in graph.items():
+        outgoing = {neighbor for neighbor, _ in neighbors}
+        sources = incoming.get(node_id, set())
+        if node_id in keep_nodes or len(outgoing) != 1 or len(sources) != 1:
+            continue
+        # A node linking back to its only source is a dead end, not part of a chain
+        if outgoing != sources:
+            chain_nodes.add(node_id)
+
+    # A closed way touching nothing else is a cycle of chain nodes only, so one of them is kept as its anchor
+    visited = set()
+    for node_id in sorted(chain_nodes):
+        walk = []
+        while node_id in chain_nodes and node_id not in visited:
+            visited.add(node_id)
+            walk.append(node_id)
+            node_id = graph[node_id][0][0]
+        if node_id in walk:
+            chain_nodes.discard(min(walk[walk.index(node_id):]))
+    return chain_nodes
+
+def follow_chain(graph: dict, chain_nodes: set, node_id: int, weight: float):
+    """Walks along a chain of contractible nodes until a node that is kept is reached.
+
+    Args:
+        graph (dict): The graph representing the connections between nodes
+        chain_nodes (set): The ids of the contractible nodes
+        node_id (int): The first node of the chain
+        weight (float): The weight of the edge leading to the first node
+
+    Returns:
+        int, float, list: The id of the node ending the chain, the summed weight, and the contracted
+        (node_id, weight from the start of the chain) pairs in order
+    """
+    interior = []
+    while node_id in chain_nodes:
+        interior.append((node_id, weight))
+        next_node, next_weight = min(graph[node_id], key=lambda edge: edge[1])
+        node_id = next_node
+        weight += next_weight
+    return node_id, weight, interior
+
+def add_packed_edges(compacted: dict, packed_edges: dict, node_a: int, node_b: int, edges: list):
+    """Adds the edges from node_a to node_b to the compacted graph.
+
+    Only the lightest edge is kept as a single edge. Other chains ending at node_b keep their first
+    node, so no contracted node is lost, while heavier direct edges are dropped.
+
+    Args:
+        compacted (dict): The compacted graph
+        packed_edges (dict): The mapping from edges to their contracted nodes
+        node_a (int): The id of the node the edges start at
+        node_b (int): The id of the node the edges end at
+        edges (list): The (summed weight, contracted nodes) of every edge, lightest first
+    """
+    weight, interior = edges[0]
+    compacted[node_a].append((node_b, weight))
+    if interior:
+        packed_edges[(node_a, node_b)] = interior
+
+    for weight, interior in edges[1:]:
+        if not interior:
+            continue
+        head, head_weight = interior[0]
+        compacted[node_a].append((head, head_weight))
+        compacted[head] = [(node_b, weight - head_weight)]
+        if len(interior) > 1:
+            packed_edges[(head, node_b)] = [(node_id, offset - head_weight) for node_id, offset in interior[1:]]
+
+def find_packed_edge(packed_edges: dict, node_id: int):
+    """Finds the contracted chain a node is part of.
+
+    Args:
+        packed_edges (dict): The mapping from edges to their contracted nodes, indexed once if it is a PackedEdges
+        node_id (int): The id of the node
+
+    Returns:
+        tuple, int: The (node_a, node_b) edge and the position of the node in its chain, or None, None
+    """
+    if not isinstance(packed_edges, PackedEdges):
+        packed_edges = PackedEdges(packed_edges).index_nodes()
+    edge = packed_edges.node_index.get(node_id)
+    if edge is None:
+        return None, None
+    return edge, [interior_node for interior_node, _ in packed_edges[edge]].index(node_id)
+
+def split_packed_edges(graph: dict, packed_edges: dict, start: int, end: int = None):
+    """Connects a start and end node that were contracted into a chain to the compacted graph.
+
+    The chains are split for this search only, without changing the compacted graph.
+
+    Args:
+        graph (dict): The compacted graph
+        packed_edges (dict): The mapping from edges to their contracted nodes
+        start (int): The id of the start node
+        end (int): The id of the end node, if any
+
+    Returns:
+        dict | SplitGraph, dict | ChainMap: The graph and packed edges to search and unpack with
+    """
+    extra_edges = {}
+    extra_packed = {}
+    start_edge, start_index = (None, None) if start in graph else find_packed_edge(packed_edges, start)
+    end_edge, end_index = (None, None) if end is None or end in graph else find_packed_edge(packed_edges, end)
+    if start_edge is None and end_edge is None:
+        return graph, packed_edges
+
+    if start_edge is not None:
+        node_a, node_b = start_edge
+        interior = packed_edges[start_edge]
+        start_offset = interior[start_index][1]
+        chain_weight = min(weight for neighbor, weight in graph[node_a] if neighbor == node_b)
+        extra_edges[start] = [(node_b, chain_weight - start_offset)]
+        extra_packed[(start, node_b)] = [(node_id, offset - start_offset) for node_id, offset in interior[start_index + 1:]]
+        if end_edge == start_edge and end_index > start_index:
+            extra_edges[start].append((end, interior[end_index][1] - start_offset))
+            extra_packed[(start, end)] = [(node_id, offset - start_offset) for node_id, offset in interior[start_index + 1:end_index]]
+
+    if end_edge is not None:
+        node_a, _ = end_edge
+        interior = packed_edges[end_edge]
+        extra_edges.setdefault(node_a, []).append((end, interior[end_index][1]))
+        extra_packed[(node_a, end)] = interior[:end_index]
+
+    return SplitGraph(graph, extra_edges), ChainMap(extra_packed, packed_edges)
+
+def unpack_path(path: list, packed_edges: dict) -> list:
+    """Expands a path found in a compacted graph to include every contracted node.
+
+    Args:
+        path (list): A list of node ids in the compacted graph
+        packed_edges (dict): The mapping from edges to their contracted nodes
+
+    Returns:
+        list: The full list of node ids in the original graph
+    """
+    if not path:
+        return []
+    full_path = [path[0]]
+    for node_a, node_b in zip(path, path[1:]):
+        full_path.extend(node_id for node_id, _ in packed_edges.get((node_a, node_b), []))
+        full_path.append(node_b)
+    return full_path
+
+def unpack_weights(node_weights: dict, packed_edges: dict, max_weight: float = float('infinity')) -> dict:
+    """Adds the weight of every contracted node reached through a reached chain start.
+
+    Args:
+        node_weights (dict): A mapping from the ids of the reached nodes in the compacted graph to their weight
+        packed_edges (dict): The mapping from edges to their contracted nodes
+        max_weight (float): The cost cutoff of the search
+
+    Returns:
+        dict: The mapping extended with the contracted nodes within the cutoff
+    """
+    full_weights = dict(node_weights)
+    for (node_a, _), interior in packed_edges.items():
+        if node_a not in node_weights:
+            continue
+        for node_id, offset in interior:
+            weight = node_weights[node_a] + offset
+            if weight > max_weight:
+                break
+            if weight < full_weights.get(node_id, float('infinity')):
+                full_weights[node_id] = weight
+    return full_weights
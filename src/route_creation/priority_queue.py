@@ -0,0 +1,236 @@
+import heapq
+import struct
+
+
+class QueueStats:
+    """A class to store the counters collected by a priority queue during a search.
+
+    args:
+        pushes (int): The number of entries pushed onto the queue
+        pops (int): The number of live entries popped from the queue
+        stale_pops (int): The number of outdated entries discarded while popping
+        decrease_keys (int): The number of in-place priority decreases
+    """
+    def __init__(self):
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.decrease_keys = 0
+
+    def as_dict(self) -> dict:
+        """Returns the counters as a dictionary.
+
+        Returns:
+            dict: The counters keyed by name
+        """
+        return {
+            'pushes': self.pushes,
+            'pops': self.pops,
+            'stale_pops': self.stale_pops,
+            'decrease_keys': self.decrease_keys,
+        }
+
+
+class BinaryHeapQueue:
+    """A binary heap priority queue using lazy deletion.
+
+    Every improvement pushes a new entry, and entries that are outdated by a later
+    improvement (or whose node has already been popped) are skipped when popped.
+    """
+    def __init__(self):
+        self.stats = QueueStats()
+        self._heap = []
+        # Popped nodes are marked with -infinity, so later entries for them are never live
+        self._best = {}
+        self._live = 0
+
+    def __len__(self):
+        return self._live
+
+    def push(self, node: int, priority: float):
+        """Inserts a node, or lowers its priority if it is already queued.
+
+        Args:
+            node (int): The id of the node
+            priority (float): The priority (weight) of the node
+        """
+        best = self._best.get(node)
+        if best is None:
+            self._live += 1
+        elif priority >= best:
+            return
+        self._best[node] = priority
+        self._insert(priority, node)
+        self.stats.pushes += 1
+
+    def pop(self):
+        """Removes the node with the lowest priority, skipping stale entries.
+
+        Returns:
+            float, int: The priority and the id of the node
+        """
+        while True:
+            priority, node = self._pop_min()
+            if priority > self._best[node]:
+                self.stats.stale_pops += 1
+                continue
+            self._best[node] = float('-infinity')
+            self._live -= 1
+            self.stats.pops += 1
+            return priority, node
+
+    def _insert(self, priority: float, node: int):
+        heapq.heappush(self._heap, (priority, node))
+
+    def _pop_min(self):
+        return heapq.heappop(self._heap)
+
+
+class IndexedDaryHeapQueue:
+    """A d-ary heap priority queue supporting decrease-key.
+
+    Each node has at most one entry, and its position in the heap is indexed so that
+    an improvement moves the existing entry instead of pushing a new one.
+
+    args:
+        arity (int): The number of children per heap node
+    """
+    def __init__(self, arity: int = 4):
+        self.stats = QueueStats()
+        self.arity = arity
+        self._heap = []
+        self._priorities = {}
+        self._positions = {}
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, node: int, priority: float):
+        """Inserts a node, or lowers its priority if it is already queued.
+
+        Args:
+            node (int): The id of the node
+            priority (float): The priority (weight) of the node
+        """
+        if node in self._positions:
+            if priority >= self._priorities[node]:
+                return
+            self._priorities[node] = priority
+            self.stats.decrease_keys += 1
+            self._sift_up(self._positions[node])
+            return
+        if node in self._priorities:
+            # The node has already been popped
+            return
+        self._priorities[node] = priority
+        self._positions[node] = len(self._heap)
+        self._heap.append(node)
+        self.stats.pushes += 1
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self):
+        """Removes the node with the lowest priority.
+
+        Returns:
+            float, int: The priority and the id of the node
+        """
+        root = self._heap[0]
+        last = self._heap.pop()
+        del self._positions[root]
+        if self._heap:
+            self._heap[0] = last
+            self._positions[last] = 0
+            self._sift_down(0)
+        self.stats.pops += 1
+        return self._priorities[root], root
+
+    def _sift_up(self, index: int):
+        node = self._heap[index]
+        priority = self._priorities[node]
+        while index > 0:
+            parent_index = (index - 1) // self.arity
+            parent = self._heap[parent_index]
+            if self._priorities[parent] <= priority:
+                break
+            self._heap[index] = parent
+            self._positions[parent] = index
+            index = parent_index
+        self._heap[index] = node
+        self._positions[node] = index
+
+    def _sift_down(self, index: int):
+        node = self._heap[index]
+        priority = self._priorities[node]
+        size = len(self._heap)
+        while True:
+            first_child = index * self.arity + 1
+            if first_child >= size:
+                break
+            best_child = min(
+                range(first_child, min(first_child + self.arity, size)),
+                key=lambda child: self._priorities[self._heap[child]])
+            child = self._heap[best_child]
+            if self._priorities[child] >= priority:
+                break
+            self._heap[index] = child
+            self._positions[child] = index
+            index = best_child
+        self._heap[index] = node
+        self._positions[node] = index
+
+
+class RadixHeapQueue(BinaryHeapQueue):
+    """A radix heap for searches where popped priorities never decrease.
+
+    Priorities are turned into integer keys using the bit pattern of the float, which
+    keeps the order of non-negative floats. An entry is stored in the bucket given by
+    the highest bit in which its key differs from the last popped key, so bucket 0 only
+    holds keys equal to it. When bucket 0 is empty, the lowest non-empty bucket is
+    redistributed around its minimum key, which moves every entry down at most 64 times.
+    Stale entries are skipped as in BinaryHeapQueue.
+    """
+    def __init__(self):
+        super().__init__()
+        self._buckets = [[] for _ in range(65)]
+        self._last_key = 0
+
+    def _insert(self, priority: float, node: int):
+        key = struct.unpack('<Q', struct.pack('<d', priority))[0]
+        self._buckets[(key ^ self._last_key).bit_length()].append((key, priority, node))
+
+    def _pop_min(self):
+        if not self._buckets[0]:
+            index = 1
+            while not self._buckets[index]:
+                index += 1
+            entries = self._buckets[index]
+            self._buckets[index] = []
+            self._last_key = min(entries)[0]
+            for entry in entries:
+                self._buckets[(entry[0] ^ self._last_key).bit_length()].append(entry)
+        _, priority, node = self._buckets[0].pop()
+        return priority, node
+
+
+QUEUE_TYPES = {
+    'binary': BinaryHeapQueue,
+    'dary': IndexedDaryHeapQueue,
+    'radix': RadixHeapQueue,
+}
+
+
+def create_priority_queue(queue_type: str = 'binary'):
+    """Creates a priority queue of the given type.
+
+    Args:
+        queue_type (str): One of 'binary', 'dary' or 'radix'
+
+    Returns:
+        BinaryHeapQueue | IndexedDaryHeapQueue | RadixHeapQueue: An empty priority queue
+
+    Raises:
+        ValueError: If the queue type is unknown
+    """
+    if queue_type not in QUEUE_TYPES:
+        raise ValueError(f"Unknown priority queue type: {queue_type}")
+    return QUEUE_TYPES[queue_type]()
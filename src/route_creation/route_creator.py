@@ -1,7 +1,9 @@
-from .dijkstra import dijkstra
+from .dijkstra import dijkstra, bounded_dijkstra
+from .graph_compaction import split_packed_edges, unpack_path, unpack_weights
 from .graph import create_graph, find_connections_for_stranded_nodes
 from .haversine import haversine
 from .step_by_step import step_by_step_guide
+from .time_dependent import find_lift_boardings, time_dependent_dijkstra
 
 
 def path_to_geojson(filtered_data:dict, path:list, weight:float):
@@ -16,12 +18,14 @@ def path_to_geojson(filtered_data:dict, path:list, weight:float):
 		dict: A GeoJSON FeatureCollection representing the shortest path
 	"""
 	
-	# Create a lookup table for node IDs to their coordinates
+	# Create a lookup table for the node IDs in the path to their coordinates
+	path_nodes = set(path)
 	node_id_to_coords = {}
 	for element in filtered_data['elements']:
 		for i, node_id in enumerate(element['nodes']):
-			lat, lon = element['geometry'][i]['lat'], element['geometry'][i]['lon']
-			node_id_to_coords[node_id] = (lat, lon)
+			if node_id in path_nodes:
+				lat, lon = element['geometry'][i]['lat'], element['geometry'][i]['lon']
+				node_id_to_coords[node_id] = (lat, lon)
 
 	# Initialize an empty GeoJSON FeatureCollection
 	geojson_data = {
@@ -57,13 +61,133 @@ def path_to_geojson(filtered_data:dict, path:list, weight:float):
 	return geojson_data
 	
 
-def generate_rated_route(start: dict[float,float], end: dict[float,float], isBestRoute: bool, overpassData: dict):
+def reachability_to_geojson(filtered_data: dict, node_weights: dict):
+	"""Converts the reachable nodes to a GeoJSON FeatureCollection of the reachable parts of every way.
+
+	Args:
+		filtered_data (dict): The filtered GeoJSON data from the Overpass API
+		node_weights (dict): A mapping from the ids of the reachable nodes to their weight
+
+	Returns:
+		dict: A GeoJSON FeatureCollection with a LineString per reachable segment and the weight of each of its nodes,
+		and a Point for every reachable node that is not part of a segment
+	"""
+	geojson_data = {
+		"type": "FeatureCollection",
+		"features": []
+	}
+
+	segment_nodes = set()
+	for element in filtered_data['elements']:
+		segment = []
+		# Split the way into runs of consecutive reachable nodes
+		for i, node_id in enumerate(element['nodes'] + [None]):
+			if node_id in node_weights:
+				segment.append(i)
+				continue
+			if len(segment) > 1:
+				geojson_data["features"].append(segment_to_feature(element, segment, node_weights))
+				segment_nodes.update(element['nodes'][j] for j in segment)
+			segment = []
+
+	# Nodes reached on their own, e.g. the start or a lift bottom whose top is beyond the cutoff
+	for element in filtered_data['elements']:
+		for i, node_id in enumerate(element['nodes']):
+			if node_id in node_weights and node_id not in segment_nodes:
+				segment_nodes.add(node_id)
+				geojson_data["features"].append(node_to_feature(element, i, node_weights))
+
+	return geojson_data
+
+def node_to_feature(element: dict, index: int, node_weights: dict):
+	"""Creates a GeoJSON Feature for a reachable node.
+
+	Args:
+		element (dict): A way element from the filtered GeoJSON data containing the node
+		index (int): The index of the node in the way
+		node_weights (dict): A mapping from the ids of the reachable nodes to their weight
+
+	Returns:
+		dict: A GeoJSON Feature with a Point geometry
+	"""
+	node_id = element['nodes'][index]
+	return {
+		"type": "Feature",
+		"geometry": {
+			"type": "Point",
+			"coordinates": (element['geometry'][index]['lon'], element['geometry'][index]['lat'])
+		},
+		"properties": {
+			"node": node_id,
+			"weight": node_weights[node_id]
+		}
+	}
+
+def segment_to_feature(element: dict, segment: list, node_weights: dict):
+	"""Creates a GeoJSON Feature for a reachable segment of a way.
+
+	Args:
+		element (dict): The way element from the filtered GeoJSON data
+		segment (list): The indices of the reachable nodes in the way
+		node_weights (dict): A mapping from the ids of the reachable nodes to their weight
+
+	Returns:
+		dict: A GeoJSON Feature with a LineString geometry
+	"""
+	tags = element.get('tags', {})
+	return {
+		"type": "Feature",
+		"geometry": {
+			"type": "LineString",
+			"coordinates": [(element['geometry'][i]['lon'], element['geometry'][i]['lat']) for i in segment]
+		},
+		"properties": {
+			"id": element.get('id'),
+			"name": tags.get('name', tags.get('ref', "?")),
+			"nodes": [element['nodes'][i] for i in segment],
+			"weights": [node_weights[element['nodes'][i]] for i in segment]
+		}
+	}
+
+def generate_reachability(start: dict[float,float], max_weight: float, isBestRoute: bool, overpassData: dict, queue_type: str = 'binary', graph: dict = None, packed_edges: dict = None):
+	"""Finds everything reachable from a point within a maximum weight using a single bounded Dijkstra search.
+
+	Args:
+		start (dict[float,float]): The coordinates of the start point
+		max_weight (float): The cost cutoff, in km or rating weight depending on isBestRoute
+		isBestRoute (bool): Whether to use the best route (rating-based) or shortest distance weights
+		overpassData (dict): The GeoJSON data from the Overpass API
+		queue_type (str): The priority queue used by the search, one of 'binary', 'dary' or 'radix'
+		graph (dict): A precompiled graph of the resort, built from overpassData if not given
+		packed_edges (dict): The contracted chains of a precompiled compacted graph
+
+	Returns:
+		dict: A GeoJSON FeatureCollection of the reachable way segments and nodes
+	"""
+	filtered_data = overpassData
+
+	start_node = find_nearest_node(start, filtered_data)
+
+	if graph is None:
+		graph = create_graph(filtered_data, isBestRoute)
+		graph = find_connections_for_stranded_nodes(graph, filtered_data, isBestRoute)
+
+	graph, packed_edges = split_packed_edges(graph, packed_edges or {}, start_node)
+	node_weights = bounded_dijkstra(graph, start_node, max_weight, queue_type)
+	node_weights = unpack_weights(node_weights, packed_edges, max_weight)
+
+	return reachability_to_geojson(filtered_data, node_weights)
+
+def generate_rated_route(start: dict[float,float], end: dict[float,float], isBestRoute: bool, overpassData: dict, queue_type: str = 'binary', graph: dict = None, packed_edges: dict = None):
 	"""Generates the most optimal route between two points using the Dijkstra algorithm.
 
 	Args:
 		start (dict[float,float]): The coordinates of the start point
 		end (dict[float,float]): The coordinates of the end point
 		overpassData (dict): The GeoJSON data from the Overpass API
+		queue_type (str): The priority queue used by the search, one of 'binary', 'dary' or 'radix'
+		graph (dict): A precompiled graph of the resort, built from overpassData if not given
+		packed_edges (dict): The contracted chains of a precompiled compacted graph
 
 	Returns:
 		dict: A GeoJSON FeatureCollection representing the shortest path
@@ -76,10 +200,13 @@ def generate_rated_route(start: dict[float,float], end: dict[float,float], isBes
 	start_node = find_nearest_node(start, filtered_data)
 	end_node = find_nearest_node(end, filtered_data)
 
-	graph = create_graph(filtered_data, isBestRoute)
-	graph = find_connections_for_stranded_nodes(graph, filtered_data, isBestRoute)
+	if graph is None:
+		graph = create_graph(filtered_data, isBestRoute)
+		graph = find_connections_for_stranded_nodes(graph, filtered_data, isBestRoute)
 
-	shortest_path, weight = dijkstra(graph, start_node, end_node)
+	graph, packed_edges = split_packed_edges(graph, packed_edges or {}, start_node, end_node)
+	shortest_path, weight = dijkstra(graph, start_node, end_node, queue_type)
+	shortest_path = unpack_path(shortest_path, packed_edges)
 
 	# Use the function and print the GeoJSON data
 	geojson_data = path_to_geojson(filtered_data, shortest_path, weight)
@@ -89,6 +216,39 @@ def generate_rated_route(start: dict[float,float], end: dict[float,float], isBes
 
 	return [geojson_data, step_guide]
 
+def generate_timed_route(start: dict[float,float], end: dict[float,float], departure_time: float, overpassData: dict, lift_schedules: dict, graph: dict = None, packed_edges: dict = None):
+	"""Generates the route with the earliest arrival between two points, taking lift opening hours and queue times into account.
+
+	Args:
+		start (dict[float,float]): The coordinates of the start point
+		end (dict[float,float]): The coordinates of the end point
+		departure_time (float): The departure time in minutes since midnight
+		overpassData (dict): The GeoJSON data from the Overpass API
+		lift_schedules (dict): A mapping from lift way ids to their LiftSchedule
+		graph (dict): A precompiled shortest distance graph of the resort, built from overpassData if not given
+		packed_edges (dict): The contracted chains of a precompiled compacted graph
+
+	Returns:
+		dict: A GeoJSON FeatureCollection representing the route, with the arrival time as weight
+	"""
+	filtered_data = overpassData
+
+	start_node = find_nearest_node(start, filtered_data)
+	end_node = find_nearest_node(end, filtered_data)
+
+	if graph is None:
+		graph = create_graph(filtered_data)
+		graph = find_connections_for_stranded_nodes(graph, filtered_data)
+
+	graph, packed_edges = split_packed_edges(graph, packed_edges or {}, start_node, end_node)
+	path, arrival_time = time_dependent_dijkstra(graph, start_node, end_node, departure_time, find_lift_boardings(filtered_data), lift_schedules)
+	path = unpack_path(path, packed_edges)
+
+	geojson_data = path_to_geojson(filtered_data, path, arrival_time)
+	step_guide = step_by_step_guide(path, filtered_data)
+
+	return [geojson_data, step_guide]
+
 def find_nearest_node(coords: dict[float,float], elements: dict):
 	"""Finds the id of the nearest node in a graph to the given coordinates.
 
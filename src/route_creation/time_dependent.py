@@ -0,0 +1,160 @@
+from bisect import bisect_right
+
+from .classes import DijkstraData
+from .dijkstra import reconstruct_path
+
+# Travel time per km of the distance graph, for both skiing and riding a lift
+MINUTES_PER_KM = 4.0
+
+
+class LiftSchedule:
+    """A class to store the opening hours and queue times of a lift.
+
+    Times are given in minutes since midnight. The wait time is piecewise constant,
+    each (time, wait) breakpoint applying until the next one. The breakpoints are kept as one
+    (times, waits) tuple that is replaced whole, so searches can read it while the queue times are updated.
+
+    args:
+        opens (float): The time the lift opens
+        closes (float): The last time a skier can board the lift
+        wait_profile (list): A list of (time, wait in minutes) breakpoints
+    """
+    __slots__ = ('opens', 'closes', 'profile')
+
+    def __init__(self, opens: float = 0, closes: float = 24 * 60, wait_profile: list = None):
+        self.opens = opens
+        self.closes = closes
+        self.profile = ([], [])
+        for time, wait in sorted(wait_profile or []):
+            self.set_wait_time(wait, time)
+
+    def wait_at(self, time: float) -> float:
+        """Finds the queue time when arriving at the lift at the given time.
+
+        Args:
+            time (float): The arrival time at the lift
+
+        Returns:
+            float: The wait in minutes
+        """
+        times, waits = self.profile
+        index = bisect_right(times, time) - 1
+        return waits[index] if index >= 0 else 0
+
+    def departure_time(self, arrival: float):
+        """Finds the earliest time a skier arriving at the lift can get on it.
+
+        Joining the queue later is considered as well, since waiting for a shorter queue can be faster.
+        This keeps later arrivals from leaving earlier, which the earliest arrival search relies on.
+
+        Args:
+            arrival (float): The arrival time at the lift
+
+        Returns:
+            float: The boarding time, or None if the lift has closed
+        """
+        if arrival > self.closes:
+            return None
+        times, waits = self.profile
+        boarding = max(arrival, self.opens)
+        index = bisect_right(times, boarding)
+        departure = boarding + (waits[index - 1] if index > 0 else 0)
+        for i in range(index, len(times)):
+            if times[i] > self.closes or times[i] >= departure:
+                break
+            departure = min(departure, times[i] + waits[i])
+        return departure
+
+    def set_wait_time(self, wait: float, from_time: float = None):
+        """Updates the queue time, swapping in a new profile so concurrent searches never see a partial update.
+
+        Args:
+            wait (float): The wait in minutes
+            from_time (float): The time the wait applies from, replaces the whole profile if not given
+        """
+        if from_time is None:
+            self.profile = ([self.opens], [wait])
+            return
+        times, waits = list(self.profile[0]), list(self.profile[1])
+        index = bisect_right(times, from_time)
+        if index > 0 and times[index - 1] == from_time:
+            waits[index - 1] = wait
+        else:
+            times.insert(index, from_time)
+            waits.insert(index, wait)
+        self.profile = (times, waits)
+
+    @classmethod
+    def from_dict(cls, data: dict, live=None):
+        """Creates a lift schedule from request data, on top of the live schedule of the lift if there is one.
+
+        Args:
+            data (dict): A dictionary with optional 'opens', 'closes' and 'waits' ([[time, wait], ...]) keys
+            live (LiftSchedule): The live schedule, whose hours and queue times apply where the request gives none
+
+        Returns:
+            LiftSchedule: The lift schedule, a new object even when merged with the live one
+        """
+        live = live or cls()
+        schedule = cls(data.get('opens', live.opens), data.get('closes', live.closes), list(zip(*live.profile)))
+        for time, wait in data.get('waits', []):
+            schedule.set_wait_time(wait, time)
+        return schedule
+
+
+def find_lift_boardings(filtered_data: dict) -> dict:
+    """Finds the first edge of every lift, which is where the queue is.
+
+    Args:
+        filtered_data (dict): The filtered geojson data
+
+    Returns:
+        dict: A mapping from the first node of a lift to {second node: lift way id}
+    """
+    lift_boardings = {}
+    for element in filtered_data['elements']:
+        if 'aerialway' in element.get('tags', {}) and len(element.get('nodes', [])) > 1:
+            lift_boardings.setdefault(element['nodes'][0], {})[element['nodes'][1]] = element['id']
+    return lift_boardings
+
+def time_dependent_dijkstra(graph: dict, start: int, end: int, departure_time: float, lift_boardings: dict,
+                            lift_schedules: dict, minutes_per_weight: float = MINUTES_PER_KM, queue_type: str = 'binary'):
+    """
+    Find the path with the earliest arrival between two nodes, waiting for lifts to open and in their queues.
+
+    Args:
+        graph (dict): The graph to search for the path
+        start (int): The id of the start node
+        end (int): The id of the end node
+        departure_time (float): The departure time in minutes since midnight
+        lift_boardings (dict): The lift boarding edges, as returned by find_lift_boardings
+        lift_schedules (dict): A mapping from lift way ids to their LiftSchedule, lifts without one have no wait
+        minutes_per_weight (float): The travel time in minutes per unit of edge weight
+        queue_type (str): The priority queue implementation, one of 'binary', 'dary' or 'radix'
+
+    Returns:
+        list, float: A list of node ids representing the path, and the arrival time at the end node
+    """
+    dijkstra_data = DijkstraData(start, queue_type, departure_time)
+
+    while dijkstra_data.priority_queue:
+        current_time, current_node = dijkstra_data.priority_queue.pop()
+
+        if current_node == end:
+            break
+
+        boardings = lift_boardings.get(current_node)
+        for neighbor, weight in graph[current_node]:
+            leave_time = current_time
+            if boardings and neighbor in boardings and boardings[neighbor] in lift_schedules:
+                leave_time = lift_schedules[boardings[neighbor]].departure_time(current_time)
+                if leave_time is None:
+                    continue
+            arrival_time = leave_time + weight * minutes_per_weight
+
+            if arrival_time < dijkstra_data.weights.get(neighbor, float('infinity')):
+                dijkstra_data.weights[neighbor] = arrival_time
+                dijkstra_data.previous_nodes[neighbor] = current_node
+                dijkstra_data.priority_queue.push(neighbor, arrival_time)
+
+    return reconstruct_path(dijkstra_data, end), dijkstra_data.weights.get(end, float('infinity'))
@@ -0,0 +1,47 @@
+import pytest
+import tracemalloc
+
+from src.route_creation.array_graph import ArrayGraph
+from src.route_creation.compiled_graph import build_route_graph, compile_resort, save_compiled_graph, load_compiled_graph
+from src.route_creation.dijkstra import dijkstra
+
+
+def test_array_graph_matches_dict_graph():
+  graph = {3: [(1, 0.5), (2, 1.5)], 1: [(2, 1.0)], 2: []}
+  array_graph = ArrayGraph.from_graph(graph)
+
+  assert list(array_graph) == [1, 2, 3]
+  assert array_graph[3] == [(1, 0.5), (2, 1.5)]
+  assert 2 in array_graph and 4 not in array_graph
+  with pytest.raises(KeyError):
+    array_graph[4]
+
+
+@pytest.mark.parametrize('isBestRoute', [False, True])
+def test_search_on_array_graph(isBestRoute, isaberg_data):
+  graph = build_route_graph(isaberg_data, isBestRoute)
+  array_graph = ArrayGraph.from_graph(graph)
+  start = next(iter(graph))
+  for end in list(graph)[::10]:
+    assert dijkstra(array_graph, start, end) == dijkstra(graph, start, end)
+
+
+def load_peak(directory, lean):
+  tracemalloc.start()
+  graph = load_compiled_graph(directory, 'isaberg', True, lean)
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return graph, peak
+
+
+def test_lean_compiled_graph_lowers_load_peak(tmp_path, isaberg_data):
+  save_compiled_graph(str(tmp_path), 'isaberg', compile_resort(isaberg_data))
+
+  graph, dict_peak = load_peak(str(tmp_path), False)
+  lean_graph, lean_peak = load_peak(str(tmp_path), True)
+
+  assert isinstance(lean_graph[0], ArrayGraph)
+  assert dict(lean_graph[0].items()) == graph[0]
+  assert lean_graph[1] == graph[1]
+  assert lean_graph[1].node_index == graph[1].node_index
+  assert lean_peak < dict_peak
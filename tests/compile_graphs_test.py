@@ -0,0 +1,21 @@
+import json
+
+from src.compile_graphs import main
+
+
+def test_compile_graphs_reports_every_resort(tmp_path, isaberg_data, capsys):
+  input_dir = tmp_path / 'overpass'
+  input_dir.mkdir()
+  (input_dir / 'isaberg.json').write_text(json.dumps(isaberg_data))
+  (input_dir / 'malformed.json').write_text('[]')
+  output_dir = tmp_path / 'compiled'
+
+  exit_code = main([str(input_dir), '--output', str(output_dir), '--jobs', '2'])
+  report = capsys.readouterr().out.splitlines()
+
+  assert exit_code == 1
+  assert report[0].startswith('isaberg: ')
+  assert '130 nodes' in report[0] and '0 unreachable lift heads' in report[0]
+  assert report[1].startswith('malformed: FAILED TypeError')
+  assert report[2] == f"Compiled 1 of 2 resorts to {output_dir}"
+  assert sorted(path.name for path in output_dir.iterdir()) == ['isaberg.best.graph.jsonl', 'isaberg.shortest.graph.jsonl']
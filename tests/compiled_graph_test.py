@@ -0,0 +1,95 @@
+import pytest
+import os
+
+from src.route_creation.compiled_graph import build_route_graph, compile_resort, save_compiled_graph, load_compiled_graph, get_compiled_graph, compiled_graph_path
+from src.route_creation.route_creator import generate_rated_route, generate_reachability, generate_timed_route
+
+
+def test_compiled_graph_round_trip(tmp_path, isaberg_data):
+  geojson_data = isaberg_data
+  compiled = compile_resort(geojson_data)
+  save_compiled_graph(str(tmp_path), 'isaberg', compiled)
+
+  assert compiled['stats']['nodes'] == len(build_route_graph(geojson_data))
+  assert compiled['stats']['compacted_nodes'] < compiled['stats']['nodes']
+  assert load_compiled_graph(str(tmp_path), 'isaberg', True) == compiled['graphs']['best']
+  assert load_compiled_graph(str(tmp_path), 'isaberg', True)[1].node_index == compiled['graphs']['best'][1].node_index
+  assert load_compiled_graph(str(tmp_path), 'unknown') is None
+
+
+def test_generate_route_with_compiled_graph(tmp_path, isaberg_data):
+  geojson_data = isaberg_data
+  save_compiled_graph(str(tmp_path), 'isaberg', compile_resort(geojson_data))
+  graph, packed_edges = load_compiled_graph(str(tmp_path), 'isaberg', False)
+
+  start = {'lat': 57.43440, 'lon': 13.61891}
+  end = {'lat': 57.43408, 'lon': 13.60994}
+  expected = generate_rated_route(start, end, False, geojson_data)
+
+  assert generate_rated_route(start, end, False, geojson_data, graph=graph, packed_edges=packed_edges) == expected
+
+
+@pytest.mark.parametrize('isBestRoute', [False, True])
+@pytest.mark.parametrize('lean', [False, True])
+def test_compiled_graph_routes_from_contracted_nodes(tmp_path, isaberg_data, isBestRoute, lean):
+  save_compiled_graph(str(tmp_path), 'isaberg', compile_resort(isaberg_data))
+  graph, packed_edges = load_compiled_graph(str(tmp_path), 'isaberg', isBestRoute, lean)
+
+  # Start and end at the coordinates of every few nodes, most of which are inside a contracted chain
+  coordinates = [geometry for element in isaberg_data['elements'] for geometry in element['geometry']][::15]
+  for start in coordinates:
+    for end in coordinates[::3]:
+      expected = generate_rated_route(start, end, isBestRoute, isaberg_data)[0]
+      result = generate_rated_route(start, end, isBestRoute, isaberg_data, graph=graph, packed_edges=packed_edges)[0]
+      if not expected['features'][0]['properties']['weight'] < float('infinity'):
+        continue
+      assert result['features'][0]['properties']['weight'] == pytest.approx(expected['features'][0]['properties']['weight'])
+      assert result['features'][0]['geometry']['coordinates'][0] == expected['features'][0]['geometry']['coordinates'][0]
+      assert result['features'][0]['geometry']['coordinates'][-1] == expected['features'][0]['geometry']['coordinates'][-1]
+
+
+def test_compiled_graph_routes_on_isolated_loop(tmp_path, isaberg_data):
+  # A closed nordic loop touching no other way
+  coordinates = [{'lat': 57.4500, 'lon': 13.6000}, {'lat': 57.4510, 'lon': 13.6000}, {'lat': 57.4510, 'lon': 13.6010}]
+  isaberg_data['elements'].append({
+    'type': 'way', 'id': 9000, 'nodes': [9001, 9002, 9003, 9001], 'geometry': coordinates + coordinates[:1],
+    'tags': {'piste:type': 'nordic'}})
+  save_compiled_graph(str(tmp_path), 'isaberg', compile_resort(isaberg_data))
+  graph, packed_edges = load_compiled_graph(str(tmp_path), 'isaberg', False)
+
+  start, end = coordinates[1], coordinates[2]
+  expected = generate_rated_route(start, end, False, isaberg_data)[0]
+  result = generate_rated_route(start, end, False, isaberg_data, graph=graph, packed_edges=packed_edges)[0]
+  assert result['features'][0]['properties']['weight'] == pytest.approx(expected['features'][0]['properties']['weight'])
+  assert generate_timed_route(start, end, 600, isaberg_data, {}, graph, packed_edges)[0]['features']
+  assert generate_reachability(start, 1, False, isaberg_data, graph=graph, packed_edges=packed_edges)['features']
+
+
+def test_compiled_graph_cache_reloads_changed_artifact(tmp_path, isaberg_data):
+  save_compiled_graph(str(tmp_path), 'isaberg', compile_resort(isaberg_data))
+  graph = get_compiled_graph(str(tmp_path), 'isaberg', True)
+
+  assert get_compiled_graph(str(tmp_path), 'isaberg', True) is graph
+
+  path = compiled_graph_path(str(tmp_path), 'isaberg', True)
+  os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+  reloaded = get_compiled_graph(str(tmp_path), 'isaberg', True)
+  assert reloaded is not graph and reloaded == graph
+
+  os.remove(path)
+  assert get_compiled_graph(str(tmp_path), 'isaberg', True) is None
+
+
+def test_save_compiled_graph_replaces_artifacts_atomically(tmp_path, isaberg_data):
+  save_compiled_graph(str(tmp_path), 'isaberg', compile_resort(isaberg_data))
+  path = compiled_graph_path(str(tmp_path), 'isaberg', True)
+
+  # A reader that opened the old artifact keeps reading it whole while it is replaced
+  with open(path, 'r') as file:
+    old_lines = file.readline()
+    save_compiled_graph(str(tmp_path), 'isaberg', compile_resort({'elements': []}))
+    old_lines += file.read()
+
+  assert old_lines.count('\n') > 1
+  assert os.path.getsize(path) == 0
+  assert sorted(os.listdir(tmp_path)) == ['isaberg.best.graph.jsonl', 'isaberg.shortest.graph.jsonl']
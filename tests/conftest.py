@@ -0,0 +1,13 @@
+import pytest
+import json
+import os
+
+
+@pytest.fixture
+def isaberg_data():
+  # Path to the JSON file relative to the test file
+  current_dir = os.path.dirname(__file__)
+  json_file_path = os.path.join(current_dir, 'geoJsonData', 'isabergData.json')
+
+  with open(json_file_path, 'r') as file:
+    return json.load(file)
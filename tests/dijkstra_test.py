@@ -0,0 +1,57 @@
+import pytest
+
+from src.route_creation.dijkstra import dijkstra, search
+from src.route_creation.graph import create_graph
+from src.route_creation.priority_queue import create_priority_queue
+
+
+@pytest.mark.parametrize('isBestRoute', [False, True])
+def test_queue_types_find_same_weight(isBestRoute, isaberg_data):
+  graph = create_graph(isaberg_data, isBestRoute)
+  nodes = list(graph)
+  start = nodes[0]
+  for end in nodes[::25]:
+    expected_weight = dijkstra(graph, start, end, 'binary')[1]
+    for queue_type in ['dary', 'radix']:
+      assert dijkstra(graph, start, end, queue_type)[1] == pytest.approx(expected_weight)
+
+
+def test_binary_queue_skips_stale_entries():
+  graph = {1: [(2, 5), (3, 1)], 2: [(4, 1)], 3: [(2, 1)], 4: [(5, 10)], 5: []}
+  dijkstra_data = search(graph, 1, 5, 'binary')
+  stats = dijkstra_data.priority_queue.stats
+
+  # Node 2 is pushed twice, the outdated entry is popped but not explored
+  assert dijkstra_data.weights[5] == 13
+  assert stats.pushes == 6
+  assert stats.pops == 5
+  assert stats.stale_pops == 1
+
+
+def test_dary_queue_decreases_key_in_place():
+  graph = {1: [(2, 5), (3, 1)], 2: [(4, 1)], 3: [(2, 1)], 4: [(5, 10)], 5: []}
+  stats = search(graph, 1, 5, 'dary').priority_queue.stats
+
+  assert stats.pushes == 5
+  assert stats.decrease_keys == 1
+  assert stats.stale_pops == 0
+
+
+def test_unknown_queue_type():
+  with pytest.raises(ValueError):
+    create_priority_queue('fibonacci')
+
+
+def test_radix_queue_pops_in_order():
+  queue = create_priority_queue('radix')
+  for node, priority in [(1, 0.75), (2, 0.0), (3, 1e-9), (4, 20 / 3), (5, 0.75)]:
+    queue.push(node, priority)
+
+  popped = []
+  while queue:
+    priority, node = queue.pop()
+    popped.append(priority)
+    # Monotone pushes after a pop are allowed, including equal priorities
+    if node == 3:
+      queue.push(6, priority)
+  assert popped == sorted(popped) == [0.0, 1e-9, 1e-9, 0.75, 0.75, 20 / 3]
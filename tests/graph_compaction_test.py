@@ -0,0 +1,80 @@
+import pytest
+
+from src.route_creation.dijkstra import dijkstra
+from src.route_creation.graph import create_graph
+from src.route_creation.graph_compaction import compact_graph, split_packed_edges, unpack_path, unpack_weights
+
+
+def test_compact_graph_contracts_chains():
+  graph = {1: [(2, 1)], 2: [(3, 2)], 3: [(4, 3)], 4: [(5, 1), (6, 1)], 5: [], 6: []}
+  compacted, packed_edges = compact_graph(graph)
+
+  assert compacted == {1: [(4, 6)], 4: [(5, 1), (6, 1)], 5: [], 6: []}
+  assert packed_edges[(1, 4)] == [(2, 1), (3, 3)]
+  assert packed_edges.node_index == {2: (1, 4), 3: (1, 4)}
+  assert unpack_path([1, 4, 6], packed_edges) == [1, 2, 3, 4, 6]
+  assert unpack_weights({1: 0, 4: 6}, packed_edges, 2) == {1: 0, 2: 1, 4: 6}
+
+
+def test_compact_graph_keeps_parallel_chains():
+  graph = {1: [(2, 1), (3, 1), (4, 5)], 2: [(4, 1)], 3: [(4, 2)], 4: []}
+  compacted, packed_edges = compact_graph(graph)
+
+  # The lightest edge to 4 is packed, the other chain keeps its first node and the heavier direct edge is dropped
+  assert compacted == {1: [(4, 2), (3, 1)], 3: [(4, 2)], 4: []}
+  assert packed_edges == {(1, 4): [(2, 1)]}
+
+
+def test_split_packed_edges_for_contracted_start_and_end():
+  graph = {1: [(2, 1)], 2: [(3, 2)], 3: [(4, 3)], 4: [(5, 4)], 5: [(6, 5)], 6: []}
+  compacted, packed_edges = compact_graph(graph)
+  assert list(compacted) == [1, 6]
+
+  search_graph, search_packed = split_packed_edges(compacted, packed_edges, 3, 5)
+  path, weight = dijkstra(search_graph, 3, 5)
+  assert (unpack_path(path, search_packed), weight) == ([3, 4, 5], 7)
+
+  search_graph, search_packed = split_packed_edges(compacted, packed_edges, 1, 4)
+  path, weight = dijkstra(search_graph, 1, 4)
+  assert (unpack_path(path, search_packed), weight) == ([1, 2, 3, 4], 6)
+
+  assert split_packed_edges(compacted, packed_edges, 1, 6) == (compacted, packed_edges)
+
+
+def test_compact_graph_keeps_requested_nodes():
+  graph = {1: [(2, 1)], 2: [(3, 2)], 3: []}
+  compacted, _ = compact_graph(graph, {2})
+
+  assert compacted == {1: [(2, 1)], 2: [(3, 2)], 3: []}
+
+
+@pytest.mark.parametrize('isBestRoute', [False, True])
+def test_compacted_search_matches_full_search(isBestRoute, isaberg_data):
+  graph = create_graph(isaberg_data, isBestRoute)
+  compacted, packed_edges = compact_graph(graph)
+  assert len(compacted) < len(graph)
+
+  nodes = list(graph)
+  for start in nodes[::13]:
+    for end in nodes[::7]:
+      path, weight = dijkstra(graph, start, end)
+      search_graph, search_packed = split_packed_edges(compacted, packed_edges, start, end)
+      compact_path, compact_weight = dijkstra(search_graph, start, end)
+
+      assert compact_weight == pytest.approx(weight)
+      if weight != float('infinity'):
+        full_path = unpack_path(compact_path, search_packed)
+        assert full_path[0] == start and full_path[-1] == end
+        assert all(node_b in {neighbor for neighbor, _ in graph[node_a]} for node_a, node_b in zip(full_path, full_path[1:]))
+
+
+def test_compact_graph_keeps_an_anchor_on_isolated_loops():
+  graph = {1: [(2, 1)], 2: [(3, 2)], 3: [(1, 3)]}
+  compacted, packed_edges = compact_graph(graph)
+
+  assert compacted == {1: [(1, 6)]}
+  assert packed_edges == {(1, 1): [(2, 1), (3, 3)]}
+
+  search_graph, search_packed = split_packed_edges(compacted, packed_edges, 2, 1)
+  path, weight = dijkstra(search_graph, 2, 1)
+  assert (unpack_path(path, search_packed), weight) == ([2, 3, 1], 5)
@@ -0,0 +1,49 @@
+import pytest
+
+from src.route_creation.compiled_graph import build_route_graph
+from src.route_creation.dijkstra import dijkstra, bounded_dijkstra
+from src.route_creation.route_creator import generate_reachability
+
+
+def test_bounded_dijkstra_stops_at_cutoff():
+  graph = {1: [(2, 1), (3, 4)], 2: [(3, 1)], 3: [(4, 2)], 4: []}
+
+  assert bounded_dijkstra(graph, 1, 2) == {1: 0, 2: 1, 3: 2}
+  assert bounded_dijkstra(graph, 1, 10) == {1: 0, 2: 1, 3: 2, 4: 4}
+
+
+def test_bounded_dijkstra_matches_point_to_point_searches(isaberg_data):
+  graph = build_route_graph(isaberg_data)
+  start = next(iter(graph))
+  node_weights = bounded_dijkstra(graph, start, 1.0)
+
+  for end in graph:
+    weight = dijkstra(graph, start, end)[1]
+    if weight <= 1.0:
+      assert node_weights[end] == pytest.approx(weight)
+    else:
+      assert end not in node_weights
+
+
+def test_generate_reachability(isaberg_data):
+  geojson_data = isaberg_data
+  start = {'lat': 57.43440, 'lon': 13.61891}
+  result = generate_reachability(start, 0.5, False, geojson_data)
+
+  assert result['type'] == 'FeatureCollection'
+  assert result['features']
+  for feature in result['features']:
+    if feature['geometry']['type'] == 'Point':
+      assert feature['properties']['weight'] <= 0.5
+      continue
+    weights = feature['properties']['weights']
+    assert len(weights) == len(feature['geometry']['coordinates']) > 1
+    assert max(weights) <= 0.5
+
+
+def test_generate_reachability_includes_isolated_nodes(isaberg_data):
+  start = {'lat': 57.43440, 'lon': 13.61891}
+  result = generate_reachability(start, 0.001, False, isaberg_data)
+
+  points = [feature for feature in result['features'] if feature['geometry']['type'] == 'Point']
+  assert [point['properties']['weight'] for point in points] == [0]
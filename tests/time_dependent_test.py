@@ -0,0 +1,76 @@
+import pytest
+
+from src.route_creation.compiled_graph import build_route_graph
+from src.route_creation.dijkstra import dijkstra
+from src.route_creation.time_dependent import LiftSchedule, MINUTES_PER_KM, find_lift_boardings, time_dependent_dijkstra
+
+
+def test_lift_schedule_wait_profile():
+  schedule = LiftSchedule(540, 960, [(540, 2), (720, 15)])
+
+  assert schedule.departure_time(500) == 542
+  assert schedule.departure_time(800) == 815
+  assert schedule.departure_time(961) is None
+
+  schedule.set_wait_time(5, 720)
+  assert schedule.departure_time(800) == 805
+  schedule.set_wait_time(1)
+  assert schedule.departure_time(800) == 801
+
+
+def test_without_schedules_matches_static_search(isaberg_data):
+  geojson_data = isaberg_data
+  graph = build_route_graph(geojson_data)
+  lift_boardings = find_lift_boardings(geojson_data)
+  start = next(iter(graph))
+  for end in list(graph)[::10]:
+    path, weight = dijkstra(graph, start, end)
+    timed_path, arrival = time_dependent_dijkstra(graph, start, end, 600, lift_boardings, {})
+    assert arrival == pytest.approx(600 + weight * MINUTES_PER_KM)
+
+
+def test_lift_wait_delays_arrival_and_closed_lift_is_avoided():
+  graph = {1: [(2, 1), (3, 5)], 2: [(4, 1)], 3: [(4, 1)], 4: []}
+  lift_boardings = {1: {2: 100}}
+  schedules = {100: LiftSchedule(0, 24 * 60, [(0, 3)])}
+
+  assert time_dependent_dijkstra(graph, 1, 4, 0, lift_boardings, schedules, 1) == ([1, 2, 4], 5)
+
+  # Updating the wait in place makes the other way faster, without rebuilding the graph
+  schedules[100].set_wait_time(10)
+  assert time_dependent_dijkstra(graph, 1, 4, 0, lift_boardings, schedules, 1) == ([1, 3, 4], 6)
+
+  schedules[100] = LiftSchedule(0, 60)
+  assert time_dependent_dijkstra(graph, 1, 4, 120, lift_boardings, schedules, 1) == ([1, 3, 4], 126)
+
+
+def test_falling_wait_profile_keeps_first_in_first_out():
+  schedule = LiftSchedule(0, 24 * 60, [(0, 30), (10, 0)])
+
+  assert schedule.departure_time(5) == 10
+  assert schedule.departure_time(10) == 10
+
+  graph = {1: [(2, 1)], 2: []}
+  assert time_dependent_dijkstra(graph, 1, 2, 5, {1: {2: 100}}, {100: schedule}, 1) == ([1, 2], 11)
+
+  # A drop in the queue after closing cannot be used
+  assert LiftSchedule(0, 8, [(0, 30), (10, 0)]).departure_time(5) == 35
+
+
+def test_request_schedule_merges_with_live_schedule():
+  live = LiftSchedule(540, 960, [(540, 2), (720, 15)])
+  schedule = LiftSchedule.from_dict({'opens': 600, 'waits': [[720, 5]]}, live)
+
+  assert (schedule.opens, schedule.closes) == (600, 960)
+  assert schedule.profile == ([540, 720], [2, 5])
+  assert live.profile == ([540, 720], [2, 15])
+
+
+def test_set_wait_time_swaps_in_a_new_profile():
+  schedule = LiftSchedule(540, 960, [(540, 2)])
+  times, waits = schedule.profile
+  schedule.set_wait_time(15, 720)
+
+  # A search holding the old profile keeps reading consistent lists
+  assert (times, waits) == ([540], [2])
+  assert schedule.profile == ([540, 720], [2, 15])